@@ -1,11 +1,84 @@
 import math
-from typing import List, Literal, Tuple
+from itertools import chain
+from typing import Dict, List, Literal, Optional, Tuple
 from urllib.parse import quote
 
+import numpy as np
 import pandas as pd
 import streamlit as st
 
 
+# 极客风样式：主区 + 侧边栏高对比度、科技感配色
+_GEEK_CSS: str = """
+<style>
+body {
+    background-color: #0b1020;
+}
+.main {
+    background-color: #0b1020;
+    color: #e0e6ff;
+}
+/* 侧边栏：护眼浅色背景，仅改侧边栏，主区不变 */
+section[data-testid="stSidebar"] {
+    background: linear-gradient(180deg, #f0f4f8 0%, #e8eef4 100%);
+    border-left: 3px solid #94a3b8;
+    box-shadow: none;
+}
+section[data-testid="stSidebar"] > div {
+    color: #334155;
+}
+section[data-testid="stSidebar"] h1,
+section[data-testid="stSidebar"] h2,
+section[data-testid="stSidebar"] h3 {
+    color: #1e293b !important;
+    font-weight: 600;
+    letter-spacing: 0.02em;
+}
+section[data-testid="stSidebar"] label {
+    color: #334155 !important;
+    font-weight: 500;
+}
+section[data-testid="stSidebar"] p {
+    color: #334155 !important;
+}
+section[data-testid="stSidebar"] .stRadio label {
+    color: #334155 !important;
+}
+section[data-testid="stSidebar"] [data-testid="stWidgetLabel"] {
+    color: #334155 !important;
+}
+section[data-testid="stSidebar"] span {
+    color: #334155 !important;
+}
+h1, h2, h3 {
+    color: #8be9fd;
+}
+.theoretical-box {
+    padding: 1rem 1.5rem;
+    border-radius: 0.5rem;
+    border: 1px solid #50fa7b33;
+    background: radial-gradient(circle at top left, #13203a, #050814);
+    color: #f8f8f2;
+    font-family: "JetBrains Mono", "Fira Code", monospace;
+}
+.theoretical-label {
+    font-size: 0.9rem;
+    color: #bd93f9;
+    text-transform: uppercase;
+    letter-spacing: 0.08em;
+}
+.theoretical-value {
+    font-size: 1.6rem;
+    font-weight: 600;
+    color: #50fa7b;
+}
+</style>
+"""
+
+# 反馈公式（LaTeX）
+_FEEDBACK_FORMULA_LATEX: str = r"V_{out} = V_{fb} \times \left(1 + \frac{R_1}{R_2}\right)"
+
+
 def resistance_search_keyword(r_k: float) -> str:
     """将阻值（kΩ）转为经销商搜索关键词，如 10.5 -> 10.5k，0.82 -> 820。"""
     if r_k >= 1000:
@@ -41,13 +114,13 @@ def yageo_0402_value_code(r_k: float) -> str:
             return f"{int(round(m_val))}M"
         return f"{int(m_val)}M{int(round((m_val % 1) * 10))}"
     if r_ohm >= 1e3:
-        k_val = r_ohm / 1e3
-        s = f"{k_val:.2f}"
-        a, b = s.split(".")
-        if int(b) == 0:
-            return f"{int(a)}K"
-        b_trim = b.rstrip("0")
-        return f"{int(a)}K{b_trim}"
+        # 以 0.01 kΩ 为单位取整后拆出整数与两位小数，末位 0 省略（10.50 -> 10K5，1.05 -> 1K05）
+        whole, frac = divmod(round(round(r_ohm / 1e3, 2) * 100), 100)
+        if frac == 0:
+            return f"{whole}K"
+        if frac % 10 == 0:
+            return f"{whole}K{frac // 10}"
+        return f"{whole}K{frac:02d}"
     if abs(r_ohm - round(r_ohm)) < 0.01:
         return f"{int(round(r_ohm))}R"
     return f"{int(r_ohm)}R{int(round((r_ohm % 1) * 10))}"
@@ -59,28 +132,36 @@ def yageo_0402_mpn(r_k: float) -> str:
     return f"RC0402FR-07{code}L"
 
 
-def resistor_purchase_urls_by_mpn(mpn: str) -> dict:
+def resistor_purchase_urls_by_mpn(mpn: str, quoted_mpn: Optional[str] = None) -> dict:
     """
     按 MPN 返回各商城搜索/产品页 URL（国际站 + 国内站）。
     - 国际：Digi-Key、Mouser、立创商城。
     - 国内：贸泽电子 (Mouser 中国)、得捷电子 (Digi-Key 中国)，使用 f-string 拼接 MPN 生成直达搜索链接。
+    - quoted_mpn 为预计算的 URL 编码结果（见 get_mpn_table），提供时跳过 quote。
     """
-    q = quote(mpn)
+    # 标准阻值的 MPN 仅含字母、数字与 '-'，两种 quote 结果一致，可共用同一编码结果
+    if quoted_mpn is None:
+        q, q_path = quote(mpn), quote(mpn, safe="")
+    else:
+        q = q_path = quoted_mpn
     return {
         "digikey": f"https://www.digikey.com/en/products/result?keywords={q}",
-        "mouser": f"https://www.mouser.com/ProductDetail/YAGEO/{quote(mpn, safe='')}",
+        "mouser": f"https://www.mouser.com/ProductDetail/YAGEO/{q_path}",
         "lcsc": f"https://www.szlcsc.com/so/s?q={q}",
         "mouser_cn": f"https://www.mouser.cn/c/?q={q}",
         "digikey_cn": f"https://www.digikey.cn/zh/products/result?keywords={q}",
     }
 
 
-def generate_e_series_values(series: Literal["E24", "E96"], min_k: float = 0.1, max_k: float = 1_000.0) -> List[float]:
+@st.cache_resource(max_entries=8)
+def generate_e_series_values(series: Literal["E24", "E96"], min_k: float = 0.1, max_k: float = 1_000.0) -> Tuple[float, ...]:
     """
     生成近似的 E 系列标准阻值（单位：kΩ）。
 
     为避免在代码中硬编码大表，这里按 IEC 逻辑在对数量表上等分后做四舍五入，
     得到与标准 E24 / E96 非常接近的一组值，足以用于工程设计与对比。
+    各十倍程的取值由基值与 10 的整数次幂做外积一次得到，返回升序去重的元组
+    （不可变，按参数缓存后可在各会话、各次重跑间安全共享）。
     """
     if series == "E24":
         steps = 24
@@ -93,35 +174,45 @@ def generate_e_series_values(series: Literal["E24", "E96"], min_k: float = 0.1,
     else:
         raise ValueError("Unsupported series")
 
-    base_values = []
-    for n in range(steps):
-        raw = 10 ** (n / steps) * scale
-        rounded = round(raw)
-        value = rounded / divisor
-        base_values.append(value)
+    base_values = np.unique(np.round(np.power(10.0, np.arange(steps) / steps) * scale) / divisor)
 
-    # 去重并排序
-    base_values = sorted(set(base_values))
+    # 覆盖 [min_k, max_k] 所需的十倍程：用整数指数直接求 10 的幂，不做浮点累乘，越界部分由下方过滤剔除
+    emin = int(math.floor(math.log10(min_k / base_values.max())))
+    emax = int(math.ceil(math.log10(max_k / base_values.min())))
+    decades = 10.0 ** np.arange(emin, emax + 1)
+    grid = np.round(np.outer(decades, base_values), 4).ravel()
 
-    values_k = []
-    decade = 0.1
-    while decade <= max_k * 1.01:
-        for v in base_values:
-            candidate = v * decade
-            if min_k <= candidate <= max_k:
-                values_k.append(candidate)
-        decade *= 10
+    # 过滤范围并去重排序（避免边界重叠）
+    return tuple(np.unique(grid[(grid >= min_k) & (grid <= max_k)]).tolist())
 
-    # 再次去重排序（避免边界重叠）
-    return sorted(set(round(v, 4) for v in values_k))
 
+@st.cache_resource
+def get_standard_resistors_k() -> np.ndarray:
+    """
+    返回合并后的 E24 + E96 标准阻值数组（单位：kΩ，升序）。
 
-@st.cache_data
-def get_standard_resistors_k() -> List[float]:
-    """返回合并后的 E24 + E96 标准阻值列表（单位：kΩ）。"""
-    e24 = generate_e_series_values("E24")
-    e96 = generate_e_series_values("E96")
-    return sorted(set(e24 + e96))
+    该表为只读参考数据，使用 cache_resource 在所有会话间共享同一数组，不做拷贝；
+    调用方请勿原地修改。
+    """
+    values = np.union1d(generate_e_series_values("E24"), generate_e_series_values("E96"))
+    values.setflags(write=False)
+    return values
+
+
+@st.cache_resource
+def get_mpn_table() -> dict:
+    """返回标准阻值（kΩ）到 (Yageo 0402 MPN, URL 编码后的 MPN) 的映射，所有会话共享。"""
+    table = {}
+    for v in get_standard_resistors_k().tolist():
+        mpn = yageo_0402_mpn(v)
+        table[v] = (mpn, quote(mpn, safe=""))
+    return table
+
+
+def lookup_yageo_0402_mpn(r_k: float) -> str:
+    """优先查预计算的标准阻值 MPN 表（按阻值精确匹配），非标准阻值再按原值现场生成。"""
+    entry = get_mpn_table().get(float(r_k))
+    return entry[0] if entry else yageo_0402_mpn(r_k)
 
 
 def calculate_theoretical_resistor(
@@ -161,47 +252,211 @@ def calculate_theoretical_resistor(
         return r2_k, "R2"
 
 
+# 结果表列顺序
+_RESULT_COLUMNS = ["R1 (kΩ)", "R2 (kΩ)", "R1 MPN (Yageo 0402)", "R2 MPN (Yageo 0402)", "实际 Vout (V)", "误差 (%)"]
+
+
+# find_best_standard_values 在理论值两侧各取的候选个数
+_SEARCH_HALF_WINDOW = 50
+
+
+def _errors(v_fb, v_target, r_fixed, cand, mode_flag):
+    """整体计算各候选的误差百分比；mode_flag 为 0 表示候选为 R1，1 表示候选为 R2。"""
+    ratio = cand / r_fixed if mode_flag == 0 else r_fixed / cand
+    return (v_fb * (1.0 + ratio) - v_target) / v_target * 100.0
+
+
+def _select_top_n(
+    mode: Literal["固定 R2 算 R1", "固定 R1 算 R2"],
+    v_out_target: float,
+    v_fb: float,
+    fixed_r_k: float,
+    cand: np.ndarray,
+    top_n: int,
+) -> np.ndarray:
+    """返回 cand 中按绝对误差升序的前 top_n 个下标。"""
+    mode_flag = 0 if mode == "固定 R2 算 R1" else 1
+    abs_err = np.abs(_errors(v_fb, v_out_target, fixed_r_k, cand, mode_flag))
+
+    # 先用 argpartition 取出前 top_n，再仅对这几项按绝对误差排序
+    n = min(top_n, cand.size)
+    idx = np.argpartition(abs_err, n - 1)[:n]
+    return idx[np.argsort(abs_err[idx], kind="stable")]
+
+
 def find_best_standard_values(
     mode: Literal["固定 R2 算 R1", "固定 R1 算 R2"],
     v_out_target: float,
     v_fb: float,
     fixed_r_k: float,
     theoretical_k: float,
-    candidates_k: List[float],
+    candidates_k: np.ndarray,
     top_n: int = 5,
 ):
     """
     针对理论精确值，在标准阻值库中寻找误差最小的前 top_n 个组合。
-    返回一个列表，每个元素为 dict，包含 R1, R2, 实际 Vout, 误差百分比。
+    返回按列组织的 dict（列名 -> 一维数组），包含 R1、R2、实际 Vout、误差百分比（float64）
+    及 R1、R2 的 MPN（object），可直接传给 pd.DataFrame 而无需逐行推断列。
+
+    candidates_k 为升序 float64 标准阻值数组（见 get_standard_resistors_k）。
+    误差由 _errors 在 NumPy 数组上整体计算，实际 Vout 与 MPN 仅对最终入选的 top_n 个组合生成。
     """
-    results = []
+    if candidates_k.size == 0 or top_n <= 0:
+        return {col: np.empty(0, dtype=object if "MPN" in col else np.float64) for col in _RESULT_COLUMNS}
+
+    # 误差随候选阻值单调变化，最优解必在理论值附近：先在窗口内求解，
+    # 若入选项触及（被截断的）窗口边缘，再退回全表扫描
+    half = max(_SEARCH_HALF_WINDOW, top_n)
+    center = int(np.searchsorted(candidates_k, theoretical_k))
+    lo = max(0, center - half)
+    hi = min(candidates_k.size, center + half)
+
+    window = candidates_k[lo:hi]
+    idx = _select_top_n(mode, v_out_target, v_fb, fixed_r_k, window, top_n)
+    if (lo > 0 and 0 in idx) or (hi < candidates_k.size and hi - lo - 1 in idx):
+        window = candidates_k
+        idx = _select_top_n(mode, v_out_target, v_fb, fixed_r_k, window, top_n)
+
+    # 仅对入选组合计算展示用的 R1、R2、实际 Vout 与误差；固定侧的 MPN 只查一次
+    selected = window[idx]
+    selected_mpn = np.array([lookup_yageo_0402_mpn(r) for r in selected.tolist()], dtype=object)
+    fixed_mpn = np.full(selected.size, lookup_yageo_0402_mpn(fixed_r_k), dtype=object)
+    if mode == "固定 R2 算 R1":
+        r1_arr, r1_mpn = selected, selected_mpn
+        r2_arr, r2_mpn = np.full_like(selected, fixed_r_k), fixed_mpn
+    else:  # 固定 R1 算 R2
+        r1_arr, r1_mpn = np.full_like(selected, fixed_r_k), fixed_mpn
+        r2_arr, r2_mpn = selected, selected_mpn
+    actual_arr = v_fb * (1.0 + r1_arr / r2_arr)
+    err_arr = (actual_arr - v_out_target) / v_out_target * 100.0
+
+    return {
+        "R1 (kΩ)": r1_arr,
+        "R2 (kΩ)": r2_arr,
+        "R1 MPN (Yageo 0402)": r1_mpn,
+        "R2 MPN (Yageo 0402)": r2_mpn,
+        "实际 Vout (V)": actual_arr,
+        "误差 (%)": err_arr,
+    }
+
+
+@st.cache_data
+def _best_df(
+    mode: Literal["固定 R2 算 R1", "固定 R1 算 R2"],
+    v_out: float,
+    v_fb: float,
+    fixed_r_k: float,
+    theoretical_k: float,
+    top_n: int = 5,
+) -> pd.DataFrame:
+    """按输入缓存前 top_n 个最佳标准阻值组合的结果表；输入不变的重跑直接命中缓存。"""
+    results = find_best_standard_values(
+        mode=mode,
+        v_out_target=v_out,
+        v_fb=v_fb,
+        fixed_r_k=fixed_r_k,
+        theoretical_k=theoretical_k,
+        candidates_k=get_standard_resistors_k(),
+        top_n=top_n,
+    )
+    return pd.DataFrame(results)[_RESULT_COLUMNS]
 
-    for cand in candidates_k:
-        # 理论值附近的候选可以适当优先，但这里直接全遍历并按误差排序
-        if mode == "固定 R2 算 R1":
-            r1_k = cand
-            r2_k = fixed_r_k
-        else:  # 固定 R1 算 R2
-            r1_k = fixed_r_k
-            r2_k = cand
-
-        actual_v_out = v_fb * (1.0 + r1_k / r2_k)
-        error_pct = (actual_v_out - v_out_target) / v_out_target * 100.0
-
-        results.append(
-            {
-                "R1 (kΩ)": r1_k,
-                "R2 (kΩ)": r2_k,
-                "R1 MPN (Yageo 0402)": yageo_0402_mpn(r1_k),
-                "R2 MPN (Yageo 0402)": yageo_0402_mpn(r2_k),
-                "实际 Vout (V)": actual_v_out,
-                "误差 (%)": error_pct,
-            }
-        )
 
-    # 以绝对误差排序，取前 top_n
-    results_sorted = sorted(results, key=lambda x: abs(x["误差 (%)"]))
-    return results_sorted[:top_n]
+# 结果表数值列的显示格式（交给 Styler.format，不改变列的数值类型）
+_RESULT_FORMATS = {
+    "R1 (kΩ)": "{:.3f}",
+    "R2 (kΩ)": "{:.3f}",
+    "实际 Vout (V)": "{:.4f}",
+    "误差 (%)": "{:+.3f}",
+}
+
+
+def _err_style(col: pd.Series) -> np.ndarray:
+    """按列返回误差单元格样式：|误差| < 1% 绿色加粗，否则红色。"""
+    v = col.abs().to_numpy()
+    return np.where(v < 1.0, "color: #50fa7b; font-weight: 600;", "color: #ff5555;")
+
+
+def _render_results(
+    mode: Literal["固定 R2 算 R1", "固定 R1 算 R2"],
+    v_out: float,
+    v_fb: float,
+    fixed_r_k: float,
+    theoretical_k: float,
+):
+    """渲染最佳标准阻值组合表与推荐采购区（计算量最大的部分）。"""
+    # 查找最佳标准阻值组合
+    df = _best_df(mode, v_out, v_fb, fixed_r_k, theoretical_k)
+
+    if df.empty:
+        st.warning("在当前标准阻值范围内未找到合适的组合，请调整参数或扩展阻值范围。")
+        return
+
+    # 仅对误差 < ±1% 的组合展示 R1、R2 的 Yageo 0402 MPN、采购链接及 MPN 表格（链接/库存/单价）；
+    # 按数值列筛选，只把入选行转为 dict
+    within_1pct = df[df["误差 (%)"].abs() < 1.0].to_dict("records")
+
+    # 设置格式与颜色（误差 < 1% 绿色）；仅格式化显示值，列保持数值类型，表头点击排序与右对齐不受影响
+    styler = df.style.format(_RESULT_FORMATS).apply(_err_style, subset=["误差 (%)"])
+
+    st.subheader("前 5 个最佳标准阻值组合")
+    st.dataframe(styler, use_container_width=True)
+
+    if not within_1pct:
+        st.caption("当前前 5 个组合误差均 ≥ ±1%，暂无推荐采购链接；可调整 Vout / Vfb / 固定电阻以获取更优组合。")
+        return
+
+    st.subheader("推荐采购（误差 < ±1%）— Yageo 0402")
+    # 基于 MPN 生成表格：第一列 MPN，第二列 Digi-Key 或 Mouser 链接（直接显示网址），第三列 库存，第四列 单价
+    # MPN 直接取自 find_best_standard_values 的结果；按 MPN 去重，每个 MPN 的链接与表格行只生成一次
+    rows_by_mpn: Dict[str, List[dict]] = {}
+    urls_cache = {}
+    mpn_table = get_mpn_table()
+    placeholder = "需在官网查看"
+    for r in within_1pct:
+        for r_k, mpn in ((r["R1 (kΩ)"], r["R1 MPN (Yageo 0402)"]), (r["R2 (kΩ)"], r["R2 MPN (Yageo 0402)"])):
+            if mpn in rows_by_mpn:
+                continue
+            entry = mpn_table.get(r_k)
+            urls = urls_cache[mpn] = resistor_purchase_urls_by_mpn(mpn, entry[1] if entry else None)
+            rows_by_mpn[mpn] = [
+                {"MPN": mpn, "链接": urls["digikey"], "库存": placeholder, "单价": placeholder},
+                {"MPN": mpn, "链接": urls["mouser_cn"], "库存": placeholder, "单价": placeholder},
+            ]
+    st.markdown("**基于 MPN 的表格（链接 / 库存 / 单价）**")
+    df_mpn = pd.DataFrame(list(chain.from_iterable(rows_by_mpn.values())))
+    st.dataframe(
+        df_mpn,
+        use_container_width=True,
+        column_config={
+            "MPN": st.column_config.TextColumn("MPN", width="medium"),
+            "链接": st.column_config.LinkColumn("链接"),
+            "库存": st.column_config.TextColumn("库存", width="small"),
+            "单价": st.column_config.TextColumn("单价", width="small"),
+        },
+        hide_index=True,
+    )
+    st.caption("库存与单价未接入 Digi-Key/Mouser API，当前显示「需在官网查看」；点击链接打开对应商城页面可查看实时库存与单价。")
+    for i, row in enumerate(within_1pct, 1):
+        r1_k, r2_k = row["R1 (kΩ)"], row["R2 (kΩ)"]
+        v_act, err = row["实际 Vout (V)"], row["误差 (%)"]
+        mpn1, mpn2 = row["R1 MPN (Yageo 0402)"], row["R2 MPN (Yageo 0402)"]
+        u1, u2 = urls_cache[mpn1], urls_cache[mpn2]
+        with st.expander(f"组合 {i}：R1 = {r1_k:.3f} kΩ，R2 = {r2_k:.3f} kΩ，实际 Vout = {v_act:.4f} V，误差 = {err:+.3f}%"):
+            st.markdown("**R1（上臂）**")
+            st.code(mpn1, language=None)
+            st.markdown("**国内元器件商城直达搜索（R1）**")
+            st.markdown(f"[贸泽电子 (Mouser 中国)]({u1['mouser_cn']}) · [得捷电子 (Digi-Key 中国)]({u1['digikey_cn']})")
+            st.markdown("**R2（下臂）**")
+            st.code(mpn2, language=None)
+            st.markdown("**国内元器件商城直达搜索（R2）**")
+            st.markdown(f"[贸泽电子 (Mouser 中国)]({u2['mouser_cn']}) · [得捷电子 (Digi-Key 中国)]({u2['digikey_cn']})")
+
+
+# 结果区作为片段渲染：Streamlit >= 1.37 为 st.fragment，1.33–1.36 为 st.experimental_fragment，更早版本直接内联。
+# 目前输入控件都在片段外的侧边栏，片段不会单独重跑；将来在结果区内加入控件时，其交互只重跑本片段。
+_fragment = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None)
+_results_fragment = _fragment(_render_results) if _fragment is not None else _render_results
 
 
 def main():
@@ -211,75 +466,7 @@ def main():
         initial_sidebar_state="expanded",
     )
 
-    # 极客风样式：主区 + 侧边栏高对比度、科技感配色
-    st.markdown(
-        """
-        <style>
-        body {
-            background-color: #0b1020;
-        }
-        .main {
-            background-color: #0b1020;
-            color: #e0e6ff;
-        }
-        /* 侧边栏：护眼浅色背景，仅改侧边栏，主区不变 */
-        section[data-testid="stSidebar"] {
-            background: linear-gradient(180deg, #f0f4f8 0%, #e8eef4 100%);
-            border-left: 3px solid #94a3b8;
-            box-shadow: none;
-        }
-        section[data-testid="stSidebar"] > div {
-            color: #334155;
-        }
-        section[data-testid="stSidebar"] h1,
-        section[data-testid="stSidebar"] h2,
-        section[data-testid="stSidebar"] h3 {
-            color: #1e293b !important;
-            font-weight: 600;
-            letter-spacing: 0.02em;
-        }
-        section[data-testid="stSidebar"] label {
-            color: #334155 !important;
-            font-weight: 500;
-        }
-        section[data-testid="stSidebar"] p {
-            color: #334155 !important;
-        }
-        section[data-testid="stSidebar"] .stRadio label {
-            color: #334155 !important;
-        }
-        section[data-testid="stSidebar"] [data-testid="stWidgetLabel"] {
-            color: #334155 !important;
-        }
-        section[data-testid="stSidebar"] span {
-            color: #334155 !important;
-        }
-        h1, h2, h3 {
-            color: #8be9fd;
-        }
-        .theoretical-box {
-            padding: 1rem 1.5rem;
-            border-radius: 0.5rem;
-            border: 1px solid #50fa7b33;
-            background: radial-gradient(circle at top left, #13203a, #050814);
-            color: #f8f8f2;
-            font-family: "JetBrains Mono", "Fira Code", monospace;
-        }
-        .theoretical-label {
-            font-size: 0.9rem;
-            color: #bd93f9;
-            text-transform: uppercase;
-            letter-spacing: 0.08em;
-        }
-        .theoretical-value {
-            font-size: 1.6rem;
-            font-weight: 600;
-            color: #50fa7b;
-        }
-        </style>
-        """,
-        unsafe_allow_html=True,
-    )
+    st.markdown(_GEEK_CSS, unsafe_allow_html=True)
 
     st.title("DC-DC 反馈电阻智能计算器")
 
@@ -312,9 +499,12 @@ def main():
                 format="%.3f",
             )
 
+    # 输入统一取 6 位小数：校验、理论值与结果表（缓存键）都基于同一组数值，避免浮点尾差导致缓存未命中
+    v_out, v_fb, fixed_r_k = round(v_out, 6), round(v_fb, 6), round(fixed_r_k, 6)
+
     # 主区域：公式展示
     st.subheader("反馈公式")
-    st.latex(r"V_{out} = V_{fb} \times \left(1 + \frac{R_1}{R_2}\right)")
+    st.latex(_FEEDBACK_FORMULA_LATEX)
 
     if v_out == 0 or v_fb == 0 or fixed_r_k == 0:
         st.info("请在左侧完整输入 Vout、Vfb 以及固定电阻值（均需大于 0）。")
@@ -340,102 +530,7 @@ def main():
             unsafe_allow_html=True,
         )
 
-    # 查找最佳标准阻值组合
-    standard_values_k = get_standard_resistors_k()
-    best_results = find_best_standard_values(
-        mode=mode,
-        v_out_target=v_out,
-        v_fb=v_fb,
-        fixed_r_k=fixed_r_k,
-        theoretical_k=theoretical_k,
-        candidates_k=standard_values_k,
-        top_n=5,
-    )
-
-    if not best_results:
-        st.warning("在当前标准阻值范围内未找到合适的组合，请调整参数或扩展阻值范围。")
-        return
-
-    df = pd.DataFrame(best_results)
-    col_order = ["R1 (kΩ)", "R2 (kΩ)", "R1 MPN (Yageo 0402)", "R2 MPN (Yageo 0402)", "实际 Vout (V)", "误差 (%)"]
-    df = df[col_order]
-
-    # 设置格式与颜色（误差 < 1% 绿色）
-    def highlight_error(val):
-        try:
-            if abs(val) < 1.0:
-                return "color: #50fa7b; font-weight: 600;"
-            else:
-                return "color: #ff5555;"
-        except Exception:
-            return ""
-
-    styler = (
-        df.style.format(
-            {
-                "R1 (kΩ)": "{:.3f}",
-                "R2 (kΩ)": "{:.3f}",
-                "实际 Vout (V)": "{:.4f}",
-                "误差 (%)": "{:+.3f}",
-            }
-        )
-        .applymap(highlight_error, subset=["误差 (%)"])
-    )
-
-    st.subheader("前 5 个最佳标准阻值组合")
-    st.dataframe(styler, use_container_width=True)
-
-    # 仅对误差 < ±1% 的组合展示 R1、R2 的 Yageo 0402 MPN、采购链接及 MPN 表格（链接/库存/单价）
-    within_1pct = [r for r in best_results if abs(r["误差 (%)"]) < 1.0]
-    if within_1pct:
-        st.subheader("推荐采购（误差 < ±1%）— Yageo 0402")
-        # 基于 MPN 生成表格：第一列 MPN，第二列 Digi-Key 或 Mouser 链接（直接显示网址），第三列 库存，第四列 单价
-        table_rows = []
-        seen_mpns = set()
-        placeholder = "需在官网查看"
-        for r in within_1pct:
-            mpn1 = yageo_0402_mpn(r["R1 (kΩ)"])
-            mpn2 = yageo_0402_mpn(r["R2 (kΩ)"])
-            for mpn in (mpn1, mpn2):
-                if mpn in seen_mpns:
-                    continue
-                seen_mpns.add(mpn)
-                urls = resistor_purchase_urls_by_mpn(mpn)
-                table_rows.append({"MPN": mpn, "链接": urls["digikey"], "库存": placeholder, "单价": placeholder})
-                table_rows.append({"MPN": mpn, "链接": urls["mouser_cn"], "库存": placeholder, "单价": placeholder})
-        if table_rows:
-            st.markdown("**基于 MPN 的表格（链接 / 库存 / 单价）**")
-            df_mpn = pd.DataFrame(table_rows)
-            st.dataframe(
-                df_mpn,
-                use_container_width=True,
-                column_config={
-                    "MPN": st.column_config.TextColumn("MPN", width="medium"),
-                    "链接": st.column_config.LinkColumn("链接"),
-                    "库存": st.column_config.TextColumn("库存", width="small"),
-                    "单价": st.column_config.TextColumn("单价", width="small"),
-                },
-                hide_index=True,
-            )
-            st.caption("库存与单价未接入 Digi-Key/Mouser API，当前显示「需在官网查看」；点击链接打开对应商城页面可查看实时库存与单价。")
-        for i, row in enumerate(within_1pct, 1):
-            r1_k, r2_k = row["R1 (kΩ)"], row["R2 (kΩ)"]
-            v_act, err = row["实际 Vout (V)"], row["误差 (%)"]
-            mpn1 = yageo_0402_mpn(r1_k)
-            mpn2 = yageo_0402_mpn(r2_k)
-            u1 = resistor_purchase_urls_by_mpn(mpn1)
-            u2 = resistor_purchase_urls_by_mpn(mpn2)
-            with st.expander(f"组合 {i}：R1 = {r1_k:.3f} kΩ，R2 = {r2_k:.3f} kΩ，实际 Vout = {v_act:.4f} V，误差 = {err:+.3f}%"):
-                st.markdown("**R1（上臂）**")
-                st.code(mpn1, language=None)
-                st.markdown("**国内元器件商城直达搜索（R1）**")
-                st.markdown(f"[贸泽电子 (Mouser 中国)]({u1['mouser_cn']}) · [得捷电子 (Digi-Key 中国)]({u1['digikey_cn']})")
-                st.markdown("**R2（下臂）**")
-                st.code(mpn2, language=None)
-                st.markdown("**国内元器件商城直达搜索（R2）**")
-                st.markdown(f"[贸泽电子 (Mouser 中国)]({u2['mouser_cn']}) · [得捷电子 (Digi-Key 中国)]({u2['digikey_cn']})")
-    else:
-        st.caption("当前前 5 个组合误差均 ≥ ±1%，暂无推荐采购链接；可调整 Vout / Vfb / 固定电阻以获取更优组合。")
+    _results_fragment(mode, v_out, v_fb, fixed_r_k, theoretical_k)
 
 
 if __name__ == "__main__":